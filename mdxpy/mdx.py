@@ -1,4 +1,5 @@
-import os
+import functools
+import sys
 from abc import abstractmethod, ABC
 from typing import Optional
 from enum import Enum
@@ -6,10 +7,16 @@ from typing import List, Optional, Union, Iterable
 import re
 
 ELEMENT_ATTRIBUTE_PREFIX = "}ELEMENTATTRIBUTES_"
+# drop spaces and escape closing brackets in a single pass
+_NORMALIZE_TABLE = str.maketrans({" ": None, "]": "]]"})
+# flatten the \r\n line breaks of generated MDX into spaces for the clipboard
+_CLIPBOARD_TABLE = str.maketrans({"\r": None, "\n": " "})
 
 
 class _Member(ABC):
     """ Parent class for MDX Member Expression Object"""
+    __slots__ = ()
+
     # control if full element unique name is used for members without explicit hierarchy
     SHORT_NOTATION = False
 
@@ -62,12 +69,21 @@ class _Member(ABC):
         return unique_name[unique_name.find('].[') + 3:unique_name.rfind('].')]
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, _Member):
+            return NotImplemented
         return self.unique_name == other.unique_name
 
     def __hash__(self):
         return hash(self.unique_name)
 
 
+def _enum_member_by_name(cls, value: str) -> Optional[Enum]:
+    # member names are upper case, so a name lookup replaces the scan over all members
+    return cls.__members__.get(value.replace(" ", "").upper())
+
+
 class DescFlag(Enum):
     SELF = 1
     AFTER = 2
@@ -85,9 +101,9 @@ class DescFlag(Enum):
     def _missing_(cls, value: str):
         if value is None:
             return None
-        for member in cls:
-            if member.name.lower() == value.replace(" ", "").lower():
-                return member
+        member = _enum_member_by_name(cls, value)
+        if member is not None:
+            return member
         # default
         raise ValueError(f"Invalid Desc Flag type: '{value}'")
 
@@ -103,9 +119,9 @@ class Order(Enum):
 
     @classmethod
     def _missing_(cls, value: str):
-        for member in cls:
-            if member.name.lower() == value.replace(" ", "").lower():
-                return member
+        member = _enum_member_by_name(cls, value)
+        if member is not None:
+            return member
         # default
         raise ValueError(f"Invalid order type: '{value}'")
 
@@ -120,18 +136,63 @@ class ElementType(Enum):
 
     @classmethod
     def _missing_(cls, value: str):
-        for member in cls:
-            if member.name.lower() == value.replace(" ", "").lower():
-                return member
+        member = _enum_member_by_name(cls, value)
+        if member is not None:
+            return member
         # default
         raise ValueError(f"Invalid element type: '{value}'")
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize(name: str) -> str:
-    return name.lower().replace(" ", "").replace("]", "]]")
+    # interned, so names that normalize alike share one object and compare by identity first
+    return sys.intern(name.lower().translate(_NORMALIZE_TABLE))
+
+
+@functools.lru_cache(maxsize=8192)
+def _build_member_unique_name(dimension: str, hierarchy: str, element: str, short_notation: bool) -> str:
+    # shared across Member instances, as the same (dimension, hierarchy, element) is requested over and over
+    if short_notation and dimension == hierarchy:
+        return sys.intern(f"[{normalize(dimension)}].[{normalize(element)}]")
+    return sys.intern(f"[{normalize(dimension)}].[{normalize(hierarchy)}].[{normalize(element)}]")
+
+
+def _copy_to_clipboard(text: str):
+    # best effort only, a missing clipboard must never fail the caller.
+    # never go through a shell, which mangles quotes, '&', '|' and line breaks
+    try:
+        import pyperclip
+        pyperclip.copy(text)
+        return
+    # pyperclip raises a RuntimeError subclass when it finds no copy mechanism
+    except (ImportError, RuntimeError):
+        pass
+
+    # pipe the text to the native clipboard tool of the platform
+    import subprocess
+    if sys.platform == "win32":
+        command, encoding = ["clip"], "utf-16"
+    elif sys.platform == "darwin":
+        command, encoding = ["pbcopy"], "utf-8"
+    else:
+        command, encoding = ["xclip", "-selection", "clipboard"], "utf-8"
+    try:
+        subprocess.run(command, input=text.encode(encoding), check=True)
+    except (OSError, subprocess.CalledProcessError):
+        # no clipboard available, the caller still prints the MDX
+        pass
+
+
+def _union_to_mdx(sets: List['MdxSet'], allow_duplicates: bool) -> str:
+    # a single set that renders in braces is a valid union on its own
+    if len(sets) == 1 and sets[0]._renders_braced:
+        return sets[0].to_mdx()
+    separator = ',' if allow_duplicates else ' + '
+    return f"{{{separator.join([set_.to_mdx() for set_ in sets])}}}"
 
 
 class CurrentMember(_Member):
+    __slots__ = ('dimension', 'hierarchy', '_unique_name')
 
     def __init__(self, dimension: str, hierarchy: str):
         self.dimension = dimension
@@ -154,6 +215,12 @@ class CurrentMember(_Member):
             return f"[{normalize(dimension)}].CURRENTMEMBER"
         return f"[{normalize(dimension)}].[{normalize(hierarchy)}].CURRENTMEMBER"
 
+    @classmethod
+    def build_hierarchy_unique_name(cls, dimension, hierarchy) -> str:
+        if cls.SHORT_NOTATION and dimension == hierarchy:
+            return f"[{normalize(dimension)}]"
+        return f"[{normalize(dimension)}].[{normalize(hierarchy)}]"
+
     @staticmethod
     def from_unique_name(unique_name: str) -> 'CurrentMember':
         dimension = CurrentMember.dimension_name_from_unique_name(unique_name)
@@ -181,6 +248,7 @@ class CurrentMember(_Member):
 
 
 class Member(_Member):
+    __slots__ = ('dimension', 'hierarchy', 'hierarchy_unique_name', 'element', '_unique_name', '_hash')
 
     def __init__(self, dimension: str, hierarchy: str, element: str):
         self.dimension = dimension
@@ -188,10 +256,11 @@ class Member(_Member):
         self.hierarchy_unique_name = self.build_hierarchy_unique_name(dimension, hierarchy)
         self.element = element
         self._unique_name = None
+        self._hash = None
 
     @property
     def unique_name(self):
-        if not self._unique_name:
+        if self._unique_name is None:
             self._unique_name = self.build_unique_name(self.dimension, self.hierarchy, self.element)
         return self._unique_name
 
@@ -199,11 +268,15 @@ class Member(_Member):
     def unique_name(self):
         return self._unique_name
 
+    def __hash__(self):
+        # unique name is fixed once rendered, so its hash is computed only once
+        if self._hash is None:
+            self._hash = hash(self.unique_name)
+        return self._hash
+
     @classmethod
     def build_unique_name(cls, dimension, hierarchy, element) -> str:
-        if cls.SHORT_NOTATION and dimension == hierarchy:
-            return f"[{normalize(dimension)}].[{normalize(element)}]"
-        return f"[{normalize(dimension)}].[{normalize(hierarchy)}].[{normalize(element)}]"
+        return _build_member_unique_name(dimension, hierarchy, element, cls.SHORT_NOTATION)
 
     @classmethod
     def build_hierarchy_unique_name(cls, dimension, hierarchy) -> str:
@@ -213,14 +286,14 @@ class Member(_Member):
 
     @staticmethod
     def from_unique_name(unique_name: str) -> 'Member':
-        dimension = Member.dimension_name_from_unique_name(unique_name)
-        element = Member.element_name_from_unique_name(unique_name)
-        if unique_name.count("].[") == 1:
+        # split once instead of scanning the name separately for dimension, hierarchy and element
+        names = unique_name[1:-1].split("].[")
+        if len(names) == 2:
+            dimension, element = names
             return Member(dimension, dimension, element)
 
-        elif unique_name.count("].[") == 2:
-            hierarchy = Member.hierarchy_name_from_unique_name(unique_name)
-            return Member(dimension, hierarchy, element)
+        elif len(names) == 3:
+            return Member(*names)
 
         else:
             raise ValueError(f"Argument '{unique_name}' must be a valid member unique name")
@@ -247,20 +320,20 @@ class Member(_Member):
 
 
 class DimensionProperty(Member):
+    __slots__ = ()
 
     def __init__(self, dimension: str, hierarchy: str, attribute: str):
         super(DimensionProperty, self).__init__(dimension, hierarchy, attribute)
 
     @staticmethod
     def from_unique_name(unique_name: str) -> 'DimensionProperty':
-        dimension = Member.dimension_name_from_unique_name(unique_name)
-        attribute = Member.element_name_from_unique_name(unique_name)
-        if unique_name.count("].[") == 1:
+        names = unique_name[1:-1].split("].[")
+        if len(names) == 2:
+            dimension, attribute = names
             return DimensionProperty(dimension, dimension, attribute)
 
-        elif unique_name.count("].[") == 2:
-            hierarchy = Member.hierarchy_name_from_unique_name(unique_name)
-            return DimensionProperty(dimension, hierarchy, attribute)
+        elif len(names) == 3:
+            return DimensionProperty(*names)
 
         else:
             raise ValueError(f"Argument '{unique_name}' must be a valid DimensionProperty unique name")
@@ -279,6 +352,8 @@ class DimensionProperty(Member):
 
 
 class CalculatedMember(Member):
+    __slots__ = ('calculation',)
+
     def __init__(self, dimension: str, hierarchy: str, element: str, calculation: str):
         super(CalculatedMember, self).__init__(dimension, hierarchy, element)
         self.calculation = calculation
@@ -319,10 +394,12 @@ class CalculatedMember(Member):
 
 
 class MdxLevelExpression:
+    __slots__ = ('dimension', 'hierarchy', 'hierarchy_unique_name')
 
     def __init__(self, dimension: str, hierarchy: Optional[str] = None):
         self.dimension = normalize(dimension)
         self.hierarchy = normalize(hierarchy) if hierarchy else self.dimension
+        self.hierarchy_unique_name = f"[{self.dimension}].[{self.hierarchy}]"
 
     @abstractmethod
     def to_mdx(self) -> str:
@@ -342,26 +419,29 @@ class MdxLevelExpression:
 
 
 class LevelNumberExpression(MdxLevelExpression):
+    __slots__ = ('level',)
 
     def __init__(self, level_number: int, dimension: str, hierarchy: str = None):
         super(LevelNumberExpression, self).__init__(dimension, hierarchy)
         self.level = level_number
 
     def to_mdx(self) -> str:
-        return f"[{self.dimension}].[{self.hierarchy}].LEVELS({self.level})"
+        return f"{self.hierarchy_unique_name}.LEVELS({self.level})"
 
 
 class LevelNameExpression(MdxLevelExpression):
+    __slots__ = ('level',)
 
     def __init__(self, level_name: str, dimension: str, hierarchy: str = None):
         super(LevelNameExpression, self).__init__(dimension, hierarchy)
         self.level = level_name
 
     def to_mdx(self) -> str:
-        return f"[{self.dimension}].[{self.hierarchy}].LEVELS(\'{self.level}\')"
+        return f"{self.hierarchy_unique_name}.LEVELS(\'{self.level}\')"
 
 
 class MemberLevelExpression(MdxLevelExpression):
+    __slots__ = ('member',)
 
     def __init__(self, member: Member):
         super(MemberLevelExpression, self).__init__(member.dimension, member.hierarchy)
@@ -372,6 +452,7 @@ class MemberLevelExpression(MdxLevelExpression):
 
 
 class MdxTuple:
+    __slots__ = ('members',)
 
     def __init__(self, members):
         self.members = list(members)
@@ -379,7 +460,7 @@ class MdxTuple:
     @staticmethod
     def of(*args: Union[str, Member]) -> 'MdxTuple':
         # handle unique element names
-        members = [Member.of(member)
+        members = [Member.from_unique_name(member)
                    if isinstance(member, str) else member
                    for member in args]
         mdx_tuple = MdxTuple(members)
@@ -394,17 +475,23 @@ class MdxTuple:
             member = Member.of(member)
         self.members.append(member)
 
+    def add_members(self, members: Iterable[Union[str, Member]]):
+        self.members.extend([
+            Member.of(member) if isinstance(member, str) else member
+            for member in members])
+
     def is_empty(self) -> bool:
         return not self.members
 
     def to_mdx(self) -> str:
-        return f"({','.join(member.unique_name for member in self.members)})"
+        return f"({','.join([member.unique_name for member in self.members])})"
 
     def __len__(self):
         return len(self.members)
 
 
 class MdxPropertiesTuple:
+    __slots__ = ('members',)
 
     def __init__(self, members):
         self.members = list(members)
@@ -412,7 +499,7 @@ class MdxPropertiesTuple:
     @staticmethod
     def of(*args: Union[str, DimensionProperty]) -> 'MdxPropertiesTuple':
         # handle unique element names
-        members = [DimensionProperty.of(member)
+        members = [DimensionProperty.from_unique_name(member)
                    if isinstance(member, str) else member
                    for member in args]
         mdx_tuple = MdxPropertiesTuple(members)
@@ -431,13 +518,19 @@ class MdxPropertiesTuple:
         return not self.members
 
     def to_mdx(self) -> str:
-        return f"{','.join(member.unique_name for member in self.members)}"
+        return f"{','.join([member.unique_name for member in self.members])}"
 
     def __len__(self):
         return len(self.members)
 
 
 class MdxSet:
+    __slots__ = ('hierarchy_unique_name',)
+
+    # whether the MDX of the set is fixed once built, so that it may be memoized
+    _cacheable = False
+    # whether the MDX of the set is wrapped in braces, so that it needs no further wrapping
+    _renders_braced = False
 
     def __init__(self):
         self.hierarchy_unique_name = None
@@ -460,58 +553,109 @@ class MdxSet:
 
 
 class CrossJoinMdxSet(MdxSet):
+    __slots__ = ('sets', '_mdx', '_cacheable')
+    _renders_braced = True
+
     def __init__(self, sets: List['MdxSet']):
         if not sets:
             raise RuntimeError('sets must not be empty')
-        self.sets = sets
+        # copied, so later changes to the caller's list do not affect the set
+        self.sets = list(sets)
+        self._mdx = None
+        self._cacheable = all(set_._cacheable for set_ in self.sets)
 
     def to_mdx(self) -> str:
-        return f"{{{' * '.join(set_.to_mdx() for set_ in self.sets)}}}"
+        if self._mdx is not None:
+            return self._mdx
+
+        mdx = f"{{{' * '.join([set_.to_mdx() for set_ in self.sets])}}}"
+        if self._cacheable:
+            self._mdx = mdx
+        return mdx
 
 
 class TuplesSet(MdxSet):
+    __slots__ = ('tuples',)
+    _renders_braced = True
+
     def __init__(self, tuples: Iterable[MdxTuple]):
-        self.tuples = tuples
+        # materialized, so a generator argument renders more than once
+        self.tuples = list(tuples)
 
     def to_mdx(self) -> str:
-        return f"{{ {','.join(tupl.to_mdx() for tupl in self.tuples)} }}"
+        return f"{{ {','.join([tupl.to_mdx() for tupl in self.tuples])} }}"
 
 
 class MultiUnionSet(MdxSet):
+    __slots__ = ('sets', 'allow_duplicates', '_mdx', '_cacheable')
+    _renders_braced = True
 
     def __init__(self, sets: List[MdxSet], allow_duplicates: bool = False):
         if not sets:
             raise RuntimeError('sets must not be empty')
 
-        self.sets = sets
+        # copied, so later changes to the caller's list do not affect the set
+        self.sets = list(sets)
         self.allow_duplicates = allow_duplicates
+        self._mdx = None
+        self._cacheable = all(set_._cacheable for set_ in self.sets)
 
     def to_mdx(self) -> str:
-        if self.allow_duplicates:
-            return f"{{{','.join(set_.to_mdx() for set_ in self.sets)}}}"
-        else:
-            return f"{{{' + '.join(set_.to_mdx() for set_ in self.sets)}}}"
+        if self._mdx is not None:
+            return self._mdx
+
+        mdx = _union_to_mdx(self.sets, self.allow_duplicates)
+        if self._cacheable:
+            self._mdx = mdx
+        return mdx
 
 
 class MdxHierarchySet(MdxSet):
+    __slots__ = ('dimension', 'hierarchy', '_mdx', '_cacheable')
 
     def __init__(self, dimension: str, hierarchy: Optional[str] = None):
         self.dimension = normalize(dimension)
         self.hierarchy = normalize(hierarchy) if hierarchy else self.dimension
+        # subclasses use it as the '[dim].[hier]' prefix in their MDX
         self.hierarchy_unique_name = self.build_hierarchy_unique_name(dimension, hierarchy)
+        # sets are not altered after construction, so the MDX is only rendered once
+        self._mdx = None
+        self._cacheable = True
+
+    def _init_from_hierarchy_set(self, hierarchy_set: 'MdxHierarchySet', *other_sets: Optional['MdxSet'],
+                                 holds_tuple: bool = False):
+        # names of an existing set are normalized already. Normalizing again would escape ']' twice
+        self.dimension = hierarchy_set.dimension
+        self.hierarchy = hierarchy_set.hierarchy
+        self.hierarchy_unique_name = hierarchy_set.hierarchy_unique_name
+        self._mdx = None
+        # a wrapper can only be memoized if all sets it holds can.
+        # a tuple can still be extended after the set is built, so a set holding one is never memoized
+        self._cacheable = not holds_tuple and hierarchy_set._cacheable and all(
+            other_set is None or other_set._cacheable for other_set in other_sets)
 
     @classmethod
-    def build_hierarchy_unique_name(cls, dimension, hierarchy) -> str:
-        return f"[{normalize(dimension)}].[{normalize(hierarchy)}]"
+    def build_hierarchy_unique_name(cls, dimension: str, hierarchy: Optional[str] = None) -> str:
+        dimension = normalize(dimension)
+        hierarchy = normalize(hierarchy) if hierarchy else dimension
+        return f"[{dimension}].[{hierarchy}]"
 
     def to_clipboard(self):
         mdx = self.to_mdx()
-        command = 'echo | set /p nul="' + mdx + '"| clip'
-        os.system(command)
+        _copy_to_clipboard(mdx)
         print(mdx)
 
-    @abstractmethod
     def to_mdx(self) -> str:
+        if self._mdx is not None:
+            return self._mdx
+
+        mdx = self._to_mdx()
+        if self._cacheable:
+            self._mdx = mdx
+        return mdx
+
+    @abstractmethod
+    def _to_mdx(self) -> str:
         pass
 
     @staticmethod
@@ -550,8 +694,9 @@ class MdxHierarchySet(MdxSet):
 
     @staticmethod
     def members(members: List[Union[str, Member]]) -> 'MdxHierarchySet':
+        # strings are unique names, parse them directly rather than through the Member.of dispatch
         members = [
-            Member.of(member)
+            Member.from_unique_name(member)
             if isinstance(member, str) else member
             for member in members]
         return ElementsHierarchySet(*members)
@@ -667,6 +812,9 @@ class MdxHierarchySet(MdxSet):
         return BottomCountHierarchySet(self, cube, mdx_tuple, top)
 
     def union(self, other_set: 'MdxHierarchySet', allow_duplicates: bool = False) -> 'MdxHierarchySet':
+        # chained unions are collected into one flat set instead of nesting UNION calls
+        if isinstance(self, (UnionHierarchySet, MultiUnionHierarchySet)) and self.allow_duplicates == allow_duplicates:
+            return MultiUnionHierarchySet(self._union_operands() + [other_set], allow_duplicates)
         return UnionHierarchySet(self, other_set, allow_duplicates)
 
     def intersect(self, other_set: 'MdxHierarchySet') -> 'MdxHierarchySet':
@@ -691,52 +839,64 @@ class MdxHierarchySet(MdxSet):
 
 
 class Tm1SubsetAllHierarchySet(MdxHierarchySet):
+    __slots__ = ()
+    _renders_braced = True
 
     def __init__(self, dimension: str, hierarchy: str = None):
         super(Tm1SubsetAllHierarchySet, self).__init__(dimension, hierarchy)
 
-    def to_mdx(self) -> str:
-        return f"{{TM1SUBSETALL([{self.dimension}].[{self.hierarchy}])}}"
+    def _to_mdx(self) -> str:
+        return f"{{TM1SUBSETALL({self.hierarchy_unique_name})}}"
 
 
 class AllMembersHierarchySet(MdxHierarchySet):
+    __slots__ = ()
+    _renders_braced = True
 
     def __init__(self, dimension: str, hierarchy: str = None):
         super(AllMembersHierarchySet, self).__init__(dimension, hierarchy)
 
-    def to_mdx(self) -> str:
-        return f"{{[{self.dimension}].[{self.hierarchy}].MEMBERS}}"
+    def _to_mdx(self) -> str:
+        return f"{{{self.hierarchy_unique_name}.MEMBERS}}"
 
 
 class AllCElementsHierarchySet(MdxHierarchySet):
+    __slots__ = ()
+    _renders_braced = True
 
     def __init__(self, dimension: str, hierarchy: str = None):
         super(AllCElementsHierarchySet, self).__init__(dimension, hierarchy)
 
-    def to_mdx(self) -> str:
-        return f"{{EXCEPT({{TM1SUBSETALL([{self.dimension}].[{self.hierarchy}])}}," \
-               f"{{TM1FILTERBYLEVEL({{TM1SUBSETALL([{self.dimension}].[{self.hierarchy}])}},0)}})}}"
+    def _to_mdx(self) -> str:
+        return f"{{EXCEPT({{TM1SUBSETALL({self.hierarchy_unique_name})}}," \
+               f"{{TM1FILTERBYLEVEL({{TM1SUBSETALL({self.hierarchy_unique_name})}},0)}})}}"
 
 
 class AllLeafElementsHierarchySet(MdxHierarchySet):
+    __slots__ = ()
+    _renders_braced = True
 
     def __init__(self, dimension: str, hierarchy: str = None):
         super(AllLeafElementsHierarchySet, self).__init__(dimension, hierarchy)
 
-    def to_mdx(self) -> str:
-        return f"{{TM1FILTERBYLEVEL({{TM1SUBSETALL([{self.dimension}].[{self.hierarchy}])}},0)}}"
+    def _to_mdx(self) -> str:
+        return f"{{TM1FILTERBYLEVEL({{TM1SUBSETALL({self.hierarchy_unique_name})}},0)}}"
 
 
 class DefaultMemberHierarchySet(MdxHierarchySet):
+    __slots__ = ()
+    _renders_braced = True
 
     def __init__(self, dimension: str, hierarchy: str = None):
         super(DefaultMemberHierarchySet, self).__init__(dimension, hierarchy)
 
-    def to_mdx(self) -> str:
-        return f"{{[{self.dimension}].[{self.hierarchy}].DEFAULTMEMBER}}"
+    def _to_mdx(self) -> str:
+        return f"{{{self.hierarchy_unique_name}.DEFAULTMEMBER}}"
 
 
 class ElementsHierarchySet(MdxHierarchySet):
+    __slots__ = ('members',)
+    _renders_braced = True
 
     def __init__(self, *members: Member):
         if not members:
@@ -745,112 +905,117 @@ class ElementsHierarchySet(MdxHierarchySet):
         super(ElementsHierarchySet, self).__init__(members[0].dimension, members[0].hierarchy)
         self.members = members
 
-    def to_mdx(self) -> str:
-        return f"{{{','.join(member.unique_name for member in self.members)}}}"
+    def _to_mdx(self) -> str:
+        # join over a list avoids the generator round trip, str.join materializes its input anyway
+        return f"{{{','.join([member.unique_name for member in self.members])}}}"
 
 
 class ParentHierarchySet(MdxHierarchySet):
+    __slots__ = ('member',)
+    _renders_braced = True
 
     def __init__(self, member: Member):
         super(ParentHierarchySet, self).__init__(member.dimension, member.hierarchy)
         self.member = member
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{{self.member.unique_name}.PARENT}}"
 
 
 class FirstChildHierarchySet(MdxHierarchySet):
+    __slots__ = ('member',)
+    _renders_braced = True
 
     def __init__(self, member: Member):
         super(FirstChildHierarchySet, self).__init__(member.dimension, member.hierarchy)
         self.member = member
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{{self.member.unique_name}.FIRSTCHILD}}"
 
 
 class LastChildHierarchySet(MdxHierarchySet):
+    __slots__ = ('member',)
+    _renders_braced = True
 
     def __init__(self, member: Member):
         super(LastChildHierarchySet, self).__init__(member.dimension, member.hierarchy)
         self.member = member
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{{self.member.unique_name}.LASTCHILD}}"
 
 
 class AncestorsHierarchySet(MdxHierarchySet):
+    __slots__ = ('member',)
+    _renders_braced = True
 
     def __init__(self, member: Member):
         super(AncestorsHierarchySet, self).__init__(member.dimension, member.hierarchy)
         self.member = member
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{{self.member.unique_name}.ANCESTORS}}"
 
 
 class AncestorHierarchySet(MdxHierarchySet):
+    __slots__ = ('member', 'ancestor')
+    _renders_braced = True
 
     def __init__(self, member: Member, ancestor: int):
         super(AncestorHierarchySet, self).__init__(member.dimension, member.hierarchy)
         self.member = member
         self.ancestor = ancestor
 
-    def to_mdx(self) -> str:
-        return f"{{ANCESTOR({self.member.unique_name},{str(self.ancestor)})}}"
+    def _to_mdx(self) -> str:
+        return f"{{ANCESTOR({self.member.unique_name},{self.ancestor})}}"
 
 
 class ChildrenHierarchySet(MdxHierarchySet):
+    __slots__ = ('member',)
+    _renders_braced = True
 
     def __init__(self, member: Member):
         super(ChildrenHierarchySet, self).__init__(member.dimension, member.hierarchy)
         self.member = member
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{{self.member.unique_name}.CHILDREN}}"
 
 
 class Tm1DrillDownMemberSet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'other_set', 'recursive')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, other_set: 'MdxHierarchySet' = None,
                  recursive: bool = True):
-        super(Tm1DrillDownMemberSet, self).__init__(
-            underlying_hierarchy_set.dimension,
-            underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set, other_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
+        self.other_set = other_set
+        self.recursive = recursive
 
-        if other_set:
-            self.set2 = other_set.to_mdx()
-        else:
-            self.set2 = "ALL"
-
-        if recursive:
-            self.recursive = ", RECURSIVE"
-        else:
-            self.recursive = ""
-
-    def to_mdx(self) -> str:
-        return f"{{TM1DRILLDOWNMEMBER({self.underlying_hierarchy_set.to_mdx()}, {self.set2}{self.recursive})}}"
+    def _to_mdx(self) -> str:
+        other_set = "ALL" if self.other_set is None else self.other_set.to_mdx()
+        recursive = ", RECURSIVE" if self.recursive else ""
+        return f"{{TM1DRILLDOWNMEMBER({self.underlying_hierarchy_set.to_mdx()}, {other_set}{recursive})}}"
 
 
 class DrillDownLevelHierarchySet(MdxHierarchySet):
+    __slots__ = ('member', 'level')
+    _renders_braced = True
 
     def __init__(self, member: Member, level: int = 1):
         super(DrillDownLevelHierarchySet, self).__init__(member.dimension, member.hierarchy)
         self.member = member
         self.level = level
 
-    def to_mdx(self) -> str:
-        startstring = ''
-        endstring = ''
-        for _ in range(self.level):
-            startstring += 'DRILLDOWNLEVEL('
-            endstring += ')'
-
-        return f"{{{startstring}{{{self.member.unique_name}}}{endstring}}}"
+    def _to_mdx(self) -> str:
+        return f"{{{'DRILLDOWNLEVEL(' * self.level}{{{self.member.unique_name}}}{')' * self.level}}}"
 
 
 class DescendantsHierarchySet(MdxHierarchySet):
+    __slots__ = ('member', 'level_or_depth', 'descFlag')
+    _renders_braced = True
 
     def __init__(self, member: Member, level_or_depth: Union[int, MdxLevelExpression] = None,
                  description_flag: DescFlag = None):
@@ -859,7 +1024,7 @@ class DescendantsHierarchySet(MdxHierarchySet):
         self.level_or_depth = level_or_depth
         self.descFlag = DescFlag(description_flag) if description_flag is not None else None
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         if isinstance(self.level_or_depth, MdxLevelExpression):
             level_expression = f', {self.level_or_depth.to_mdx()}'
         else:
@@ -870,25 +1035,32 @@ class DescendantsHierarchySet(MdxHierarchySet):
 
 
 class RangeHierarchySet(MdxHierarchySet):
+    __slots__ = ('_start_member', '_end_member')
+    _renders_braced = True
+
     def __init__(self, start_member: Member, end_member: Member):
         super(RangeHierarchySet, self).__init__(start_member.dimension, start_member.hierarchy)
         self._start_member = start_member
         self._end_member = end_member
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{{self._start_member.unique_name}:{self._end_member.unique_name}}}"
 
 
 class Tm1SubsetToSetHierarchySet(MdxHierarchySet):
+    __slots__ = ('subset',)
+    _renders_braced = True
+
     def __init__(self, dimension: str, hierarchy: str, subset: str):
         super(Tm1SubsetToSetHierarchySet, self).__init__(dimension, hierarchy)
         self.subset = subset
 
-    def to_mdx(self) -> str:
-        return f'{{TM1SUBSETTOSET([{self.dimension}].[{self.hierarchy}],"{self.subset}")}}'
+    def _to_mdx(self) -> str:
+        return f'{{TM1SUBSETTOSET({self.hierarchy_unique_name},"{self.subset}")}}'
 
 
 class StrHierarchySet(MdxHierarchySet):
+    __slots__ = ()
 
     def __init__(self, dimension: str, hierarchy: str, mdx: str):
         super(StrHierarchySet, self).__init__(dimension, hierarchy)
@@ -899,122 +1071,130 @@ class StrHierarchySet(MdxHierarchySet):
 
 
 class FilterByPropertyHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'property_name', 'property_values', 'operator', 'typed',
+                 '_adjusted_values')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, property_name: str,
                  property_values: List,
                  operator: str = '=', typed: bool = False):
-        super(FilterByPropertyHierarchySet, self).__init__(underlying_hierarchy_set.dimension,
-                                                           underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.property_name = property_name
         self.property_values = property_values
         self.operator = operator
         self.typed = typed
+        self._adjusted_values = [f'"{value}"' if isinstance(value, str) else value
+                                 for value
+                                 in property_values]
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         typed_argument = ", TYPED" if self.typed else ""
-        current_member = CurrentMember.of(self.underlying_hierarchy_set.dimension,
-                                          self.underlying_hierarchy_set.hierarchy)
-        property_mdx = f"{current_member.unique_name}.PROPERTIES('{self.property_name}'{typed_argument})"
-
-        adjusted_values = [f'"{value}"' if isinstance(value, str) else value
-                           for value
-                           in self.property_values]
+        property_mdx = f"{self.hierarchy_unique_name}.CURRENTMEMBER.PROPERTIES('{self.property_name}'{typed_argument})"
 
         mdx_filter = " OR ".join(
             f"{property_mdx}{self.operator}{value}"
             for value
-            in adjusted_values)
+            in self._adjusted_values)
 
         return f"{{FILTER({self.underlying_hierarchy_set.to_mdx()},{mdx_filter})}}"
 
 
 class FilterByAttributeHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'attribute_name', 'attribute_values', 'operator', '_mdx_filter')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, attribute_name: str, attribute_values: List[str],
                  operator: str = '='):
-        super(FilterByAttributeHierarchySet, self).__init__(underlying_hierarchy_set.dimension,
-                                                            underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.attribute_name = attribute_name
         self.attribute_values = attribute_values
         self.operator = operator
+        self._mdx_filter = self._build_filter()
 
-    def to_mdx(self) -> str:
+    def _build_filter(self) -> str:
+        # the filter only depends on constructor arguments, so it is built once up front
         element_attribute_cube = ELEMENT_ATTRIBUTE_PREFIX + self.dimension
-
         adjusted_values = [f'"{value}"' if isinstance(value, str) else str(value)
                            for value
                            in self.attribute_values]
+        if not adjusted_values:
+            return ""
 
-        mdx_filter = " OR ".join(
-            f"[{element_attribute_cube}].([{element_attribute_cube}].[{self.attribute_name}]){self.operator}{value}"
-            for value
-            in adjusted_values)
+        # TM1 MDX has no IN operator, so the predicate stays an OR chain. The comparison prefix is identical
+        # for every value and is rendered once, then used as the join separator.
+        predicate = f"[{element_attribute_cube}].([{element_attribute_cube}].[{self.attribute_name}]){self.operator}"
+        return predicate + (" OR " + predicate).join(adjusted_values)
 
-        return f"{{FILTER({self.underlying_hierarchy_set.to_mdx()},{mdx_filter})}}"
+    def _to_mdx(self) -> str:
+        return f"{{FILTER({self.underlying_hierarchy_set.to_mdx()},{self._mdx_filter})}}"
 
 
 class Tm1FilterByPattern(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'wildcard')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, wildcard: str):
-        super(Tm1FilterByPattern, self).__init__(underlying_hierarchy_set.dimension, underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.wildcard = wildcard
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{TM1FILTERBYPATTERN({self.underlying_hierarchy_set.to_mdx()},'{self.wildcard}')}}"
 
 
 class Tm1FilterByLevelHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'level')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, level: int):
-        super(Tm1FilterByLevelHierarchySet, self).__init__(underlying_hierarchy_set.dimension,
-                                                           underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.level = level
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{TM1FILTERBYLEVEL({self.underlying_hierarchy_set.to_mdx()},{self.level})}}"
 
 
 class Tm1FilterByElementTypeHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'element_type')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, element_type: Union[ElementType, str]):
-        super(Tm1FilterByElementTypeHierarchySet, self).__init__(underlying_hierarchy_set.dimension,
-                                                                 underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.element_type = ElementType(element_type)
 
-    def to_mdx(self) -> str:
-        return f"{{FILTER({self.underlying_hierarchy_set.to_mdx()},[{self.dimension}].[{self.hierarchy}]" \
+    def _to_mdx(self) -> str:
+        return f"{{FILTER({self.underlying_hierarchy_set.to_mdx()},{self.hierarchy_unique_name}" \
                f".CURRENTMEMBER.PROPERTIES('ELEMENT_TYPE')='{self.element_type.value}')}}"
 
 
 class FilterByCellValueHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'cube', 'mdx_tuple', 'operator', 'value', '_adjusted_value')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, cube: str, mdx_tuple: MdxTuple, operator, value):
-        super(FilterByCellValueHierarchySet, self).__init__(
-            underlying_hierarchy_set.dimension,
-            underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set, holds_tuple=True)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.cube = normalize(cube)
         self.mdx_tuple = mdx_tuple
         self.operator = operator
         self.value = value
+        self._adjusted_value = f"'{value}'" if isinstance(value, str) else value
 
-    def to_mdx(self) -> str:
-        adjusted_value = f"'{self.value}'" if isinstance(self.value, str) else self.value
-        return f"{{FILTER({self.underlying_hierarchy_set.to_mdx()},[{self.cube}].{self.mdx_tuple.to_mdx()}{self.operator}{adjusted_value})}}"
+    def _to_mdx(self) -> str:
+        return f"{{FILTER({self.underlying_hierarchy_set.to_mdx()},[{self.cube}].{self.mdx_tuple.to_mdx()}{self.operator}{self._adjusted_value})}}"
 
 
 class FilterByInstr(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'cube', 'mdx_tuple', 'substring', 'operator', 'position', 'case_insensitive')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set, cube: str, mdx_tuple: MdxTuple, substring: str, operator: str = ">",
                  position: int = "0", case_insensitive=True):
-        super(FilterByInstr, self).__init__(
-            underlying_hierarchy_set.dimension,
-            underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set, holds_tuple=True)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.cube = normalize(cube)
         self.mdx_tuple = mdx_tuple
@@ -1023,201 +1203,230 @@ class FilterByInstr(MdxHierarchySet):
         self.position = position
         self.case_insensitive = case_insensitive
 
-    def to_mdx(self) -> str:
-        return f"{{FILTER({self.underlying_hierarchy_set.to_mdx()},INSTR({'LCASE(' if self.case_insensitive else ''}" \
-               f"[{self.cube}].{self.mdx_tuple.to_mdx()}{')' if self.case_insensitive else ''},'{self.substring}')" \
+    def _to_mdx(self) -> str:
+        cell_value = f"[{self.cube}].{self.mdx_tuple.to_mdx()}"
+        if self.case_insensitive:
+            cell_value = f"LCASE({cell_value})"
+        return f"{{FILTER({self.underlying_hierarchy_set.to_mdx()},INSTR({cell_value},'{self.substring}')" \
                f"{self.operator}{self.position})}}"
 
 
 class OrderByCellValueHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'cube', 'mdx_tuple', 'order')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, cube: str, mdx_tuple: MdxTuple,
                  order: Union[Order, str] = Order.BASC):
-        super(OrderByCellValueHierarchySet, self).__init__(underlying_hierarchy_set.dimension,
-                                                           underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set, holds_tuple=True)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.cube = normalize(cube)
         self.mdx_tuple = mdx_tuple
         self.order = Order(order)
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{ORDER({self.underlying_hierarchy_set.to_mdx()},[{self.cube}].{self.mdx_tuple.to_mdx()},{self.order})}}"
 
 
 class OrderByAttributeValueHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'attribute_name', 'order')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, attribute_name: str,
                  order: Union[str, Order] = Order.BASC):
-        super(OrderByAttributeValueHierarchySet, self).__init__(underlying_hierarchy_set.dimension,
-                                                                underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.attribute_name = normalize(attribute_name)
         self.order = Order(order)
 
-    def to_mdx(self) -> str:
-        return f"{{ORDER({self.underlying_hierarchy_set.to_mdx()},[{self.underlying_hierarchy_set.dimension}].[{self.underlying_hierarchy_set.hierarchy}].CURRENTMEMBER.PROPERTIES(\"{self.attribute_name}\"), {self.order})}}"
+    def _to_mdx(self) -> str:
+        return f"{{ORDER({self.underlying_hierarchy_set.to_mdx()},{self.underlying_hierarchy_set.hierarchy_unique_name}.CURRENTMEMBER.PROPERTIES(\"{self.attribute_name}\"), {self.order})}}"
 
 
 class Tm1SortHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'ascending')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, ascending: bool):
-        super(Tm1SortHierarchySet, self).__init__(underlying_hierarchy_set.dimension,
-                                                  underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.ascending = ascending
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{TM1SORT({self.underlying_hierarchy_set.to_mdx()},{'ASC' if self.ascending else 'DESC'})}}"
 
 
 class HierarchizeSet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set',)
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet):
-        super(HierarchizeSet, self).__init__(underlying_hierarchy_set.dimension,
-                                             underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{HIERARCHIZE({self.underlying_hierarchy_set.to_mdx()})}}"
 
 
 class HeadHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'head')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, head: int):
-        super(HeadHierarchySet, self).__init__(underlying_hierarchy_set.dimension, underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.head = head
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{HEAD({self.underlying_hierarchy_set.to_mdx()},{self.head})}}"
 
 
 class TailHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'tail')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, tail: int):
-        super(TailHierarchySet, self).__init__(underlying_hierarchy_set.dimension, underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.tail = tail
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{TAIL({self.underlying_hierarchy_set.to_mdx()},{self.tail})}}"
 
 
 class SubsetHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'start', 'length')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, start: int, length: int):
-        super(SubsetHierarchySet, self).__init__(underlying_hierarchy_set.dimension, underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.start = start
         self.length = length
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{SUBSET({self.underlying_hierarchy_set.to_mdx()},{self.start},{self.length})}}"
 
 
 class UnionHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'other_hierarchy_set', 'allow_duplicates')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, other_hierarchy_set: MdxHierarchySet,
                  allow_duplicates: bool):
-        super(UnionHierarchySet, self).__init__(underlying_hierarchy_set.dimension, underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set, other_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.other_hierarchy_set = other_hierarchy_set
         self.allow_duplicates = allow_duplicates
 
-    def to_mdx(self) -> str:
+    def _union_operands(self) -> List[MdxHierarchySet]:
+        operands = []
+        for hierarchy_set in (self.underlying_hierarchy_set, self.other_hierarchy_set):
+            if isinstance(hierarchy_set, (UnionHierarchySet, MultiUnionHierarchySet)) \
+                    and hierarchy_set.allow_duplicates == self.allow_duplicates:
+                operands.extend(hierarchy_set._union_operands())
+            else:
+                operands.append(hierarchy_set)
+        return operands
+
+    def _to_mdx(self) -> str:
         return f"{{UNION({self.underlying_hierarchy_set.to_mdx()},{self.other_hierarchy_set.to_mdx()}{', ALL' if self.allow_duplicates else ''})}}"
 
 
 class IntersectHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'other_hierarchy_set')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, other_hierarchy_set: MdxHierarchySet):
-        super(IntersectHierarchySet, self).__init__(underlying_hierarchy_set.dimension,
-                                                    underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set, other_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.other_hierarchy_set = other_hierarchy_set
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{INTERSECT({self.underlying_hierarchy_set.to_mdx()},{self.other_hierarchy_set.to_mdx()})}}"
 
 
 class ExceptHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'other_hierarchy_set')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, other_hierarchy_set: MdxHierarchySet):
-        super(ExceptHierarchySet, self).__init__(underlying_hierarchy_set.dimension, underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set, other_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.other_hierarchy_set = other_hierarchy_set
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{EXCEPT({self.underlying_hierarchy_set.to_mdx()},{self.other_hierarchy_set.to_mdx()})}}"
 
 
 class TopCountHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'cube', 'mdx_tuple', 'top')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, cube: str, mdx_tuple: MdxTuple, top: int):
-        super(TopCountHierarchySet, self).__init__(
-            underlying_hierarchy_set.dimension,
-            underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set, holds_tuple=True)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.cube = normalize(cube)
         self.mdx_tuple = mdx_tuple
         self.top = top
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{TOPCOUNT({self.underlying_hierarchy_set.to_mdx()},{self.top},[{self.cube}].{self.mdx_tuple.to_mdx()})}}"
 
 
 class BottomCountHierarchySet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'cube', 'mdx_tuple', 'top')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, cube: str, mdx_tuple: MdxTuple, top: int):
-        super(BottomCountHierarchySet, self).__init__(
-            underlying_hierarchy_set.dimension,
-            underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set, holds_tuple=True)
         self.underlying_hierarchy_set = underlying_hierarchy_set
         self.cube = normalize(cube)
         self.mdx_tuple = mdx_tuple
         self.top = top
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{BOTTOMCOUNT({self.underlying_hierarchy_set.to_mdx()},{self.top},[{self.cube}].{self.mdx_tuple.to_mdx()})}}"
 
 
 class GenerateAttributeToMemberSet(MdxHierarchySet):
+    __slots__ = ('underlying_hierarchy_set', 'attribute', '_member_prefix')
+    _renders_braced = True
 
     def __init__(self, underlying_hierarchy_set: MdxHierarchySet, attribute: str, dimension: str, hierarchy: str):
-        super(GenerateAttributeToMemberSet, self).__init__(
-            underlying_hierarchy_set.dimension,
-            underlying_hierarchy_set.hierarchy)
+        self._init_from_hierarchy_set(underlying_hierarchy_set)
         self.underlying_hierarchy_set = underlying_hierarchy_set
-        self.dimension = dimension.lower()
-        self.hierarchy = hierarchy.lower() if hierarchy else self.dimension
+        self.dimension = sys.intern(dimension.lower())
+        self.hierarchy = sys.intern(hierarchy.lower()) if hierarchy else self.dimension
         self.attribute = attribute
+        self._member_prefix = f"[{self.dimension}].[{self.hierarchy}].["
 
-    def to_mdx(self) -> str:
+    def _to_mdx(self) -> str:
         return f"{{GENERATE({self.underlying_hierarchy_set.to_mdx()}," \
-               f"{{STRTOMEMBER('[{self.dimension}].[{self.hierarchy}].[' + [{self.underlying_hierarchy_set.dimension}].[{self.underlying_hierarchy_set.hierarchy}].CURRENTMEMBER.PROPERTIES(\"{self.attribute}\") + ']')}})}}"
+               f"{{STRTOMEMBER('{self._member_prefix}' + {self.underlying_hierarchy_set.hierarchy_unique_name}.CURRENTMEMBER.PROPERTIES(\"{self.attribute}\") + ']')}})}}"
 
 
 class MultiUnionHierarchySet(MdxHierarchySet):
+    __slots__ = ('sets', 'allow_duplicates')
+    _renders_braced = True
 
     def __init__(self, sets: List[MdxHierarchySet], allow_duplicates: bool = False):
         if not sets:
             raise RuntimeError('sets must not be empty')
 
-        super(MultiUnionHierarchySet, self).__init__(
-            sets[0].dimension,
-            sets[0].hierarchy)
-
-        self.sets = sets
+        self.sets = list(sets)
+        self._init_from_hierarchy_set(self.sets[0], *self.sets[1:])
         self.allow_duplicates = allow_duplicates
 
-    def to_mdx(self) -> str:
-        if self.allow_duplicates:
-            return f"{{{','.join(set_.to_mdx() for set_ in self.sets)}}}"
-        else:
-            return f"{{{' + '.join(set_.to_mdx() for set_ in self.sets)}}}"
+    def _union_operands(self) -> List[MdxHierarchySet]:
+        return list(self.sets)
+
+    def _to_mdx(self) -> str:
+        return _union_to_mdx(self.sets, self.allow_duplicates)
 
 
 class MdxAxis:
+    __slots__ = ('tuples', 'dim_sets', 'non_empty')
+
     def __init__(self):
         self.tuples: List[MdxTuple] = list()
         self.dim_sets: List[MdxSet] = list()
@@ -1228,13 +1437,13 @@ class MdxAxis:
         return MdxAxis()
 
     def add_tuple(self, mdx_tuple: MdxTuple):
-        if bool(self.dim_sets):
+        if self.dim_sets:
             raise ValueError("Can not add tuple to axis that contains sets")
 
         self.tuples.append(mdx_tuple)
 
     def add_set(self, mdx_set: MdxSet):
-        if bool(self.tuples):
+        if self.tuples:
             raise ValueError("Can not add set to axis that contains tuples")
 
         if not isinstance(mdx_set, MdxSet):
@@ -1242,6 +1451,26 @@ class MdxAxis:
 
         self.dim_sets.append(mdx_set)
 
+    def add_tuples(self, mdx_tuples: Iterable[MdxTuple]):
+        if self.dim_sets:
+            raise ValueError("Can not add tuple to axis that contains sets")
+
+        mdx_tuples = list(mdx_tuples)
+        if not all(isinstance(mdx_tuple, MdxTuple) for mdx_tuple in mdx_tuples):
+            raise ValueError("Can not add MDX Sets or Members to axis using tuple method")
+
+        self.tuples.extend(mdx_tuples)
+
+    def add_sets(self, mdx_sets: Iterable[MdxSet]):
+        if self.tuples:
+            raise ValueError("Can not add set to axis that contains tuples")
+
+        mdx_sets = list(mdx_sets)
+        if not all(isinstance(mdx_set, MdxSet) for mdx_set in mdx_sets):
+            raise ValueError("Can not add MDX Tuples to axis using set method")
+
+        self.dim_sets.extend(mdx_sets)
+
     def is_empty(self) -> bool:
         return not self.dim_sets and not self.tuples
 
@@ -1255,7 +1484,7 @@ class MdxAxis:
         return f"""{"NON EMPTY " if self.non_empty else ""}{"TM1IGNORE_BADTUPLES " if tm1_ignore_bad_tuples else ""}{self.dim_sets_to_mdx(head, tail) if self.dim_sets else self.tuples_to_mdx(head, tail)}"""
 
     def dim_sets_to_mdx(self, head: int = None, tail: int = None) -> str:
-        mdx = " * ".join(dim_set.to_mdx() for dim_set in self.dim_sets)
+        mdx = " * ".join([dim_set.to_mdx() for dim_set in self.dim_sets])
         if head is not None:
             mdx = f"{{HEAD({mdx}, {head})}}"
         if tail is not None:
@@ -1264,7 +1493,7 @@ class MdxAxis:
         return mdx
 
     def tuples_to_mdx(self, head: int = None, tail: int = None) -> str:
-        mdx = f"{{{','.join(tupl.to_mdx() for tupl in self.tuples)}}}"
+        mdx = f"{{{','.join([tupl.to_mdx() for tupl in self.tuples])}}}"
         if head is not None:
             mdx = f"{{HEAD({mdx}, {head})}}"
         if tail is not None:
@@ -1274,16 +1503,23 @@ class MdxAxis:
 
 
 class MdxBuilder:
+    __slots__ = ('cube', 'axes', '_where', 'axes_properties', 'calculated_members', '_tm1_ignore_bad_tuples')
+
     def __init__(self, cube: str):
         self.cube = normalize(cube)
-        self.axes = {0: MdxAxis.empty()}
-        self._where = MdxTuple.empty()
+        # axes by position. Positions that were never used are None
+        self.axes: List[Optional[MdxAxis]] = [MdxAxis.empty()]
+        # created on the first member, most queries come without a where clause
+        self._where: Optional[MdxTuple] = None
         # dimension properties by axis
         self.axes_properties = {0: MdxPropertiesTuple.empty()}
         self.calculated_members = list()
         self._tm1_ignore_bad_tuples = False
 
     def get_axis_composition(self, axis_number):
+        # unused positions raise a KeyError, as they did when axes were stored by position in a dict
+        if not self._has_axis(axis_number):
+            raise KeyError(axis_number)
         composition = []
         if self.axes[axis_number].tuples:
             for tuple in self.axes[axis_number].tuples:
@@ -1295,10 +1531,25 @@ class MdxBuilder:
 
         return composition
 
+    def _has_axis(self, axis: int) -> bool:
+        return 0 <= axis < len(self.axes) and self.axes[axis] is not None
+
+    @staticmethod
+    def _get_or_create_axis(axes: List[Optional[MdxAxis]], axis: int) -> MdxAxis:
+        # a negative position would silently address an existing axis from the end of the list
+        if axis < 0:
+            raise ValueError(f"axis: '{axis}' must not be negative")
+        if axis >= len(axes):
+            axes.extend([None] * (axis + 1 - len(axes)))
+        if axes[axis] is None:
+            axes[axis] = MdxAxis.empty()
+        return axes[axis]
+
     def get_composition(self):
         titles, rows, columns = [], [], []
         #titles
-        titles = [hierarchy.hierarchy_unique_name for hierarchy in self._where.members]
+        if self._where is not None:
+            titles = [hierarchy.hierarchy_unique_name for hierarchy in self._where.members]
         #columns
         columns = self.get_axis_composition(0)
         #rows
@@ -1321,10 +1572,7 @@ class MdxBuilder:
         return self.non_empty(1)
 
     def non_empty(self, axis: int) -> 'MdxBuilder':
-        if axis not in self.axes:
-            self.axes[axis] = MdxAxis.empty()
-
-        self.axes[axis].set_non_empty()
+        self._get_or_create_axis(self.axes, axis).set_non_empty()
         return self
 
     def tm1_ignore_bad_tuples(self, ignore=True) -> 'MdxBuilder':
@@ -1340,9 +1588,7 @@ class MdxBuilder:
         return self
 
     def add_member_tuple_to_axis(self, axis: int, *args: Union[str, Member, MdxTuple]) -> 'MdxBuilder':
-        if axis not in self.axes:
-            self.axes[axis] = MdxAxis.empty()
-        return self._add_tuple_to_axis(self.axes[axis], *args)
+        return self._add_tuple_to_axis(self._get_or_create_axis(self.axes, axis), *args)
 
     def add_member_tuple_to_columns(self, *args: Union[str, Member, MdxTuple]) -> 'MdxBuilder':
         return self.add_member_tuple_to_axis(0, *args)
@@ -1366,23 +1612,39 @@ class MdxBuilder:
         return self.add_set_to_axis(axis, mdx_hierarchy_set)
 
     def add_set_to_axis(self, axis: int, mdx_set: MdxSet) -> 'MdxBuilder':
-        if axis not in self.axes:
-            self.axes[axis] = MdxAxis.empty()
+        self._get_or_create_axis(self.axes, axis).add_set(mdx_set)
+        return self
 
-        self.axes[axis].add_set(mdx_set)
+    def add_hierarchy_sets_to_axis(self, axis: int, mdx_hierarchy_sets: Iterable[MdxHierarchySet]) -> 'MdxBuilder':
+        return self.add_sets_to_axis(axis, mdx_hierarchy_sets)
+
+    def add_sets_to_axis(self, axis: int, mdx_sets: Iterable[MdxSet]) -> 'MdxBuilder':
+        self._get_or_create_axis(self.axes, axis).add_sets(mdx_sets)
+        return self
+
+    def add_member_tuples_to_axis(self, axis: int, mdx_tuples: Iterable[MdxTuple]) -> 'MdxBuilder':
+        self._get_or_create_axis(self.axes, axis).add_tuples(mdx_tuples)
         return self
 
     def add_empty_set_to_axis(self, axis: int):
-        if axis in self.axes:
+        if self._has_axis(axis):
             raise ValueError(f"axis: '{axis}' must be empty")
 
         hierarchy_set = MdxHierarchySet.from_str("", "", "{}")
         return self.add_hierarchy_set_to_axis(axis, hierarchy_set)
 
     def add_member_to_where(self, member: Union[str, Member]) -> 'MdxBuilder':
+        if self._where is None:
+            self._where = MdxTuple.empty()
         self._where.add_member(member)
         return self
 
+    def add_members_to_where(self, members: Iterable[Union[str, Member]]) -> 'MdxBuilder':
+        if self._where is None:
+            self._where = MdxTuple.empty()
+        self._where.add_members(members)
+        return self
+
     def add_member_to_properties(self, axis: int, member: Union[str, DimensionProperty]) -> 'MdxBuilder':
         if axis in self.axes_properties:
             self.axes_properties[axis].add_member(member)
@@ -1391,13 +1653,16 @@ class MdxBuilder:
         return self
 
     def where(self, *args: Union[str, Member]) -> 'MdxBuilder':
+        members = []
         for member in args:
             if isinstance(member, str):
                 member = Member.of(member)
             if not isinstance(member, Member):
                 raise ValueError(f"Argument '{member}' must be of type str or Member")
-            self.add_member_to_where(member)
-        return self
+            members.append(member)
+
+        # all arguments are validated before the where clause is touched
+        return self.add_members_to_where(members)
 
     def add_properties_to_row_axis(self, *args: Union[str, DimensionProperty]) -> 'MdxBuilder':
         return self.add_properties(1, *args)
@@ -1438,46 +1703,63 @@ class MdxBuilder:
 
     def to_mdx(self, head_columns: int = None, head_rows: int = None, tail_columns: int = None, tail_rows: int = None,
                skip_dimension_properties: bool = False) -> str:
-        mdx_with = "WITH\r\n" + "\r\n".join(
-            calculated_member.to_mdx()
-            for calculated_member
-            in self.calculated_members) + "\r\n"
-
         head_by_axis_position = {0: head_columns, 1: head_rows}
         tail_by_axis_position = {0: tail_columns, 1: tail_rows}
 
-        mdx_axes = ",\r\n".join(
-            self._axis_mdx(
+        # collect all fragments and join once, rather than nesting intermediate strings
+        mdx_parts = []
+        if self.calculated_members:
+            mdx_parts.append("WITH\r\n")
+            for calculated_member in self.calculated_members:
+                mdx_parts.append(calculated_member.to_mdx())
+                mdx_parts.append("\r\n")
+
+        mdx_parts.append("SELECT\r\n")
+        separator = ""
+        for position, axis in enumerate(self.axes):
+            if axis is None:
+                continue
+            mdx_parts.append(separator)
+            separator = ",\r\n"
+            # an empty axis contributes an empty fragment, its separator is kept
+            if axis.is_empty():
+                continue
+            mdx_parts.append(self._axis_mdx(
                 position,
                 # default for head, tail is False for axes beyond rows and columns
                 head=head_by_axis_position.get(position, None),
                 tail=tail_by_axis_position.get(position, None),
-                skip_dimension_properties=skip_dimension_properties)
-            for position
-            in self.axes)
+                skip_dimension_properties=skip_dimension_properties))
+        mdx_parts.append("\r\nFROM [")
+        mdx_parts.append(self.cube)
+        mdx_parts.append("]")
 
-        mdx_where = "\r\nWHERE " + self._where.to_mdx() if not self._where.is_empty() else ""
+        if self._where is not None and not self._where.is_empty():
+            mdx_parts.append("\r\nWHERE ")
+            mdx_parts.append(self._where.to_mdx())
 
-        return f"""{mdx_with if self.calculated_members else ""}SELECT\r\n{mdx_axes}\r\nFROM [{self.cube}]{mdx_where}"""
+        return "".join(mdx_parts)
 
     def to_clipboard(self):
         mdx = self.to_mdx()
-        mdx = mdx.replace('\r\n', ' ')
-        command = 'echo | set /p nul="' + mdx + '"| clip'
-        os.system(command)
+        mdx = mdx.translate(_CLIPBOARD_TABLE)
+        _copy_to_clipboard(mdx)
         print(mdx)
 
 
 class MultiMdxBuilder(MdxBuilder):
+    __slots__ = ('multi_dimension', 'multi_hierarchy', 'multi_subsets', 'axes_list')
+
     def __init__(self, cube: str, multi_dimension: str, multi_hierarchy: str, multi_subsets: List[str],
                  multi_axis: int = 1):
         super(MultiMdxBuilder, self).__init__(cube)
         self.multi_dimension = multi_dimension
         self.multi_hierarchy = multi_hierarchy
         self.multi_subsets = multi_subsets
-        self.axes_list = [{multi_axis: MdxAxis.empty()} for _ in self.multi_subsets]
+        # one list of axes by position per subset, like MdxBuilder.axes
+        self.axes_list = [[] for _ in self.multi_subsets]
         for i, axes in enumerate(self.axes_list):
-            axes[multi_axis].add_set(
+            self._get_or_create_axis(axes, multi_axis).add_set(
                 mdx_set=MdxHierarchySet.tm1_subset_to_set(
                     multi_dimension,
                     multi_hierarchy,
@@ -1489,24 +1771,30 @@ class MultiMdxBuilder(MdxBuilder):
         return MultiMdxBuilder(cube, multi_dimension, multi_hierarchy, multi_subsets, multi_axis)
 
     def non_empty(self, axis: int) -> 'MultiMdxBuilder':
-        for axes_index, axes in enumerate(self.axes_list):
-            if axis not in axes:
-                self.axes_list[axes_index][axis] = MdxAxis.empty()
-            self.axes_list[axes_index][axis].set_non_empty()
+        for axes in self.axes_list:
+            self._get_or_create_axis(axes, axis).set_non_empty()
         return self
 
     def add_member_tuple_to_axis(self, axis: int, *args: Union[str, Member, MdxTuple]) -> 'MultiMdxBuilder':
-        for axes_index, axes in enumerate(self.axes_list):
-            if axis not in axes:
-                self.axes_list[axes_index][axis] = MdxAxis.empty()
-            self._add_tuple_to_axis(self.axes_list[axes_index][axis], *args)
+        for axes in self.axes_list:
+            self._add_tuple_to_axis(self._get_or_create_axis(axes, axis), *args)
         return self
 
     def add_set_to_axis(self, axis: int, mdx_set: MdxSet) -> 'MultiMdxBuilder':
-        for axes_index, axes in enumerate(self.axes_list):
-            if axis not in axes:
-                self.axes_list[axes_index][axis] = MdxAxis.empty()
-            self.axes_list[axes_index][axis].add_set(mdx_set)
+        for axes in self.axes_list:
+            self._get_or_create_axis(axes, axis).add_set(mdx_set)
+        return self
+
+    def add_sets_to_axis(self, axis: int, mdx_sets: Iterable[MdxSet]) -> 'MultiMdxBuilder':
+        mdx_sets = list(mdx_sets)
+        for axes in self.axes_list:
+            self._get_or_create_axis(axes, axis).add_sets(mdx_sets)
+        return self
+
+    def add_member_tuples_to_axis(self, axis: int, mdx_tuples: Iterable[MdxTuple]) -> 'MultiMdxBuilder':
+        mdx_tuples = list(mdx_tuples)
+        for axes in self.axes_list:
+            self._get_or_create_axis(axes, axis).add_tuples(mdx_tuples)
         return self
 
     def _axis_mdx(self, axes_index: int, position: int, head: int = None, tail: int = None,
@@ -1531,16 +1819,23 @@ class MultiMdxBuilder(MdxBuilder):
 
     def to_mdx(self, head_columns: int = None, head_rows: int = None, tail_columns: int = None, tail_rows: int = None,
                skip_dimension_properties: bool = False) -> List[str]:
-        mdx_list = []
-        for axes_index, axes in enumerate(self.axes_list):
-            mdx_with = "WITH\r\n" + "\r\n".join(
-                calculated_member.to_mdx()
+        head_by_axis_position = {0: head_columns, 1: head_rows}
+        tail_by_axis_position = {0: tail_columns, 1: tail_rows}
+
+        # WITH and WHERE clauses are identical for all queries
+        mdx_with = ""
+        if self.calculated_members:
+            mdx_with = "WITH\r\n" + "".join([
+                calculated_member.to_mdx() + "\r\n"
                 for calculated_member
-                in self.calculated_members) + "\r\n"
+                in self.calculated_members])
+        mdx_where = ""
+        if self._where is not None and not self._where.is_empty():
+            mdx_where = "\r\nWHERE " + self._where.to_mdx()
 
-            head_by_axis_position = {0: head_columns, 1: head_rows}
-            tail_by_axis_position = {0: tail_columns, 1: tail_rows}
-            mdx_axes = ",\r\n".join(
+        mdx_list = []
+        for axes_index, axes in enumerate(self.axes_list):
+            mdx_axes = ",\r\n".join([
                 self._axis_mdx(
                     axes_index,
                     position,
@@ -1548,20 +1843,17 @@ class MultiMdxBuilder(MdxBuilder):
                     head=head_by_axis_position.get(position, None),
                     tail=tail_by_axis_position.get(position, None),
                     skip_dimension_properties=skip_dimension_properties)
-                for position
-                in sorted(axes))
-
-            mdx_where = "\r\nWHERE " + self._where.to_mdx() if not self._where.is_empty() else ""
+                for position, axis
+                in enumerate(axes)
+                if axis is not None])
 
-            mdx_list.append(
-                f"""{mdx_with if self.calculated_members else ""}SELECT\r\n{mdx_axes}\r\nFROM [{self.cube}]{mdx_where}""")
+            mdx_list.append("".join([mdx_with, "SELECT\r\n", mdx_axes, "\r\nFROM [", self.cube, "]", mdx_where]))
 
         return mdx_list
 
     def to_clipboard(self):
         mdx_list = self.to_mdx()
         for mdx in mdx_list:
-            mdx = mdx.replace('\r\n', ' ')
-            command = 'echo | set /p nul="' + mdx + '"| clip'
-            os.system(command)
+            mdx = mdx.translate(_CLIPBOARD_TABLE)
+            _copy_to_clipboard(mdx)
             print(mdx)
@@ -19,6 +19,7 @@ setup(
     tests_require=['pytest'],
     python_requires='>=3.5',
     install_requires=[],
+    extras_require={'clipboard': ['pyperclip']},
     classifiers=[
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
@@ -1,4 +1,8 @@
+import io
+import subprocess
+import sys
 import unittest
+from unittest import mock
 
 import pytest
 
@@ -19,6 +23,9 @@ class Test(unittest.TestCase):
         value = normalize("ele me]nt")
         self.assertEqual(value, "eleme]]nt")
 
+    def test_normalize_interned(self):
+        self.assertIs(normalize("Ele Ment"), normalize("ELEMENT"))
+
     def test_member_of_one_arg(self):
         dimension_element = Member.of("[Dimension].[Element]")
         self.assertEqual(dimension_element.dimension, "Dimension")
@@ -55,6 +62,27 @@ class Test(unittest.TestCase):
         element = Member.of("Dim", "Hier", "Elem")
         self.assertEqual(element.unique_name, "[dim].[hier].[elem]")
 
+    def test_member_hash(self):
+        element = Member.of("Dim", "Hier", "Elem")
+        self.assertEqual(hash(element), hash("[dim].[hier].[elem]"))
+        self.assertEqual(hash(element), hash(Member.of("DIM", "Hier", "E lem")))
+        self.assertEqual(len({element, Member.of("[dim].[hier].[elem]")}), 1)
+
+    def test_member_eq_other_type(self):
+        element = Member.of("Dim", "Hier", "Elem")
+        self.assertEqual(element, element)
+        self.assertNotEqual(element, "[dim].[hier].[elem]")
+
+    def test_member_not_shared(self):
+        element = Member.of("Dim", "Elem")
+        other_element = Member.of("Dim", "Elem")
+        element.element = "Other"
+        self.assertEqual("[dim].[dim].[elem]", other_element.unique_name)
+
+    def test_dimension_property_keyword_arguments(self):
+        dimension_property = DimensionProperty(dimension="Dim", hierarchy="Hier", attribute="Attr")
+        self.assertEqual("[dim].[hier].[attr]", dimension_property.unique_name)
+
     def test_current_member_of_one_arg_mdx(self):
         dimension_element = CurrentMember.of("[Dimension].CurrentMember")
         self.assertEqual(dimension_element.dimension, "Dimension")
@@ -217,6 +245,19 @@ class Test(unittest.TestCase):
         self.assertEqual(tupl.members[0], Member.of("Dimension1", "Hierarchy1", "Element1"))
         self.assertEqual(tupl.members[1], Member.of("Dimension2", "Hierarchy2", "Element2"))
 
+    def test_mdx_tuple_add_element_after_to_mdx(self):
+        tupl = MdxTuple.of(Member.of("Dimension1", "Hierarchy1", "Element1"))
+        self.assertEqual("([dimension1].[hierarchy1].[element1])", tupl.to_mdx())
+
+        tupl.add_member(Member.of("Dimension2", "Hierarchy2", "Element2"))
+        self.assertEqual(
+            "([dimension1].[hierarchy1].[element1],[dimension2].[hierarchy2].[element2])",
+            tupl.to_mdx())
+
+    def test_mdx_hierarchy_set_to_mdx_cached(self):
+        hierarchy_set = MdxHierarchySet.all_members("Dimension", "Hierarchy").filter_by_level(0)
+        self.assertIs(hierarchy_set.to_mdx(), hierarchy_set.to_mdx())
+
     def test_mdx_hierarchy_set_tm1_subset_all(self):
         hierarchy_set = MdxHierarchySet.tm1_subset_all("Dimension")
         self.assertEqual(
@@ -290,6 +331,40 @@ class Test(unittest.TestCase):
             "{[dimension].[dimension].[element3]}}",
             hierarchy_set.to_mdx())
 
+    def test_mdx_set_unions_single_set(self):
+        hierarchy_set = MdxSet.unions([
+            MdxHierarchySet.children(Member.of("Dimension", "element1"))
+        ])
+
+        self.assertEqual(
+            "{[dimension].[dimension].[element1].CHILDREN}",
+            hierarchy_set.to_mdx())
+
+    def test_mdx_set_unions_single_unbraced_set(self):
+        class NamedSet(MdxSet):
+            def to_mdx(self) -> str:
+                return "[named set]"
+
+        self.assertEqual("{[named set]}", MdxSet.unions([NamedSet()]).to_mdx())
+
+    def test_mdx_hierarchy_set_unions_single_unbraced_subclass(self):
+        class CustomHierarchySet(MdxHierarchySet):
+            def to_mdx(self) -> str:
+                return "[custom]"
+
+        hierarchy_set = MdxHierarchySet.unions([CustomHierarchySet("Dimension")])
+
+        self.assertEqual("{[custom]}", hierarchy_set.to_mdx())
+
+    def test_mdx_hierarchy_set_unions_single_custom_set(self):
+        hierarchy_set = MdxHierarchySet.unions([
+            MdxHierarchySet.from_str("Dimension", "Dimension", "[Dimension].[Element1]")
+        ])
+
+        self.assertEqual(
+            "{[Dimension].[Element1]}",
+            hierarchy_set.to_mdx())
+
     def test_mdx_set_cross_joins(self):
         mdx_set = MdxSet.cross_joins([
             MdxHierarchySet.children(Member.of("Dimension", "element1")),
@@ -303,6 +378,31 @@ class Test(unittest.TestCase):
             " * {[dimension].[dimension].[element3]}}",
             mdx_set.to_mdx())
 
+    def test_mdx_hierarchy_set_build_hierarchy_unique_name(self):
+        self.assertEqual("[dim].[dim]", MdxHierarchySet.build_hierarchy_unique_name("Dim"))
+        self.assertEqual("[dim].[hier]]]", MdxHierarchySet.build_hierarchy_unique_name("Dim", "Hier]"))
+
+    def test_mdx_set_cross_joins_after_change(self):
+        sets = [MdxHierarchySet.member(Member.of("Dimension1", "Element1"))]
+        mdx_set = MdxSet.cross_joins(sets)
+        mdx_set.to_mdx()
+
+        sets.append(MdxHierarchySet.member(Member.of("Dimension2", "Element2")))
+
+        self.assertEqual("{{[dimension1].[dimension1].[element1]}}", mdx_set.to_mdx())
+
+    def test_mdx_set_unions_of_tuples_after_change(self):
+        mdx_tuple = MdxTuple.of(Member.of("Dimension1", "Element1"))
+        mdx_set = MdxSet.unions([MdxSet.tuples([mdx_tuple]), MdxHierarchySet.all_members("Dimension1", "Dimension1")])
+        mdx_set.to_mdx()
+
+        mdx_tuple.add_member(Member.of("Dimension2", "Element2"))
+
+        self.assertEqual(
+            "{{ ([dimension1].[dimension1].[element1],[dimension2].[dimension2].[element2]) }"
+            " + {[dimension1].[dimension1].MEMBERS}}",
+            mdx_set.to_mdx())
+
     def test_mdx_set_tuples(self):
         mdx_set = MdxSet.tuples([
             MdxTuple([Member.of("dimension1", "element1"), Member.of("dimension2", "element3")]),
@@ -316,6 +416,16 @@ class Test(unittest.TestCase):
             "([dimension1].[dimension1].[element3],[dimension2].[dimension2].[element1]) }",
             mdx_set.to_mdx())
 
+    def test_mdx_set_tuples_from_generator(self):
+        mdx_set = MdxSet.tuples(
+            MdxTuple([Member.of("dimension1", element), Member.of("dimension2", "element1")])
+            for element in ("element1", "element2"))
+
+        expected_mdx = "{ ([dimension1].[dimension1].[element1],[dimension2].[dimension2].[element1])," \
+                       "([dimension1].[dimension1].[element2],[dimension2].[dimension2].[element1]) }"
+        self.assertEqual(expected_mdx, mdx_set.to_mdx())
+        self.assertEqual(expected_mdx, mdx_set.to_mdx())
+
     def test_mdx_hierarchy_set_parent(self):
         hierarchy_set = MdxHierarchySet.parent(Member.of("Dimension", "Element"))
 
@@ -463,6 +573,14 @@ class Test(unittest.TestCase):
             '=1)}',
             hierarchy_set.to_mdx())
 
+    def test_mdx_filter_by_property_escaped_bracket(self):
+        hierarchy_set = MdxHierarchySet.all_members("Dimen]sion", "Hierarchy").filter_by_property("P", ["x"])
+
+        self.assertEqual(
+            "{FILTER({[dimen]]sion].[hierarchy].MEMBERS},"
+            "[dimen]]sion].[hierarchy].CURRENTMEMBER.PROPERTIES('P')=\"x\")}",
+            hierarchy_set.to_mdx())
+
     def test_mdx_filter_by_property_multiple(self):
         hierarchy_set = MdxHierarchySet.tm1_subset_all("Dimension").filter_by_property("WEIGHT",
                                                                                        [1, -1])
@@ -496,6 +614,15 @@ class Test(unittest.TestCase):
             "[dimension].[hierarchy].CURRENTMEMBER.PROPERTIES('ELEMENT_TYPE')='1')}",
             hierarchy_set.to_mdx())
 
+    def test_mdx_hierarchy_set_filter_by_element_type_escaped_bracket(self):
+        hierarchy_set = MdxHierarchySet.all_members("Dimen]sion", "Hierarchy").filter_by_element_type(
+            ElementType.NUMERIC)
+
+        self.assertEqual(
+            "{FILTER({[dimen]]sion].[hierarchy].MEMBERS},"
+            "[dimen]]sion].[hierarchy].CURRENTMEMBER.PROPERTIES('ELEMENT_TYPE')='1')}",
+            hierarchy_set.to_mdx())
+
     def test_mdx_hierarchy_set_filter_by_element_type_str(self):
         hierarchy_set = MdxHierarchySet.all_members("Dimension", "Hierarchy").filter_by_element_type("Numeric")
 
@@ -659,6 +786,27 @@ class Test(unittest.TestCase):
             "{UNION({[dimension].[dimension].[element1]},{[dimension].[dimension].[element2]})}",
             hierarchy_set.to_mdx())
 
+    def test_mdx_hierarchy_set_union_chained(self):
+        hierarchy_set = MdxHierarchySet.member(Member.of("dimension", "element1")) \
+            .union(MdxHierarchySet.member(Member.of("dimension", "element2"))) \
+            .union(MdxHierarchySet.member(Member.of("dimension", "element3")))
+
+        self.assertEqual(
+            "{{[dimension].[dimension].[element1]}"
+            " + {[dimension].[dimension].[element2]}"
+            " + {[dimension].[dimension].[element3]}}",
+            hierarchy_set.to_mdx())
+
+    def test_mdx_hierarchy_set_union_chained_mixed_duplicates(self):
+        hierarchy_set = MdxHierarchySet.member(Member.of("dimension", "element1")) \
+            .union(MdxHierarchySet.member(Member.of("dimension", "element2"))) \
+            .union(MdxHierarchySet.member(Member.of("dimension", "element3")), allow_duplicates=True)
+
+        self.assertEqual(
+            "{UNION({UNION({[dimension].[dimension].[element1]},{[dimension].[dimension].[element2]})},"
+            "{[dimension].[dimension].[element3]}, ALL)}",
+            hierarchy_set.to_mdx())
+
     def test_mdx_hierarchy_set_intersect(self):
         hierarchy_set = MdxHierarchySet.member(Member.of("dimension", "element1")). \
             intersect(MdxHierarchySet.member(Member.of("dimension", "element2")))
@@ -834,6 +982,106 @@ class Test(unittest.TestCase):
             "FROM [cube]",
             mdx)
 
+    def test_mdx_builder_multi_axes_added_out_of_order(self):
+        mdx = MdxBuilder.from_cube("cube") \
+            .add_hierarchy_set_to_axis(2, MdxHierarchySet.member(Member.of("Dim3", "Elem3"))) \
+            .add_hierarchy_set_to_axis(0, MdxHierarchySet.member(Member.of("Dim1", "Elem1"))) \
+            .add_hierarchy_set_to_axis(1, MdxHierarchySet.member(Member.of("Dim2", "Elem2"))) \
+            .to_mdx()
+
+        self.assertEqual(
+            "SELECT\r\n"
+            "{[dim1].[dim1].[elem1]} DIMENSION PROPERTIES MEMBER_NAME ON 0,\r\n"
+            "{[dim2].[dim2].[elem2]} DIMENSION PROPERTIES MEMBER_NAME ON 1,\r\n"
+            "{[dim3].[dim3].[elem3]} DIMENSION PROPERTIES MEMBER_NAME ON 2\r\n"
+            "FROM [cube]",
+            mdx)
+
+    def test_mdx_builder_to_mdx_after_change(self):
+        mdx_builder = MdxBuilder.from_cube("cube") \
+            .add_hierarchy_set_to_axis(0, MdxHierarchySet.member(Member.of("Dim1", "Elem1")))
+        mdx_builder.to_mdx()
+
+        mdx_builder.where(Member.of("Dim2", "Elem2"))
+
+        self.assertEqual(
+            "SELECT\r\n"
+            "{[dim1].[dim1].[elem1]} DIMENSION PROPERTIES MEMBER_NAME ON 0\r\n"
+            "FROM [cube]\r\n"
+            "WHERE ([dim2].[dim2].[elem2])",
+            mdx_builder.to_mdx())
+
+    def test_mdx_builder_to_mdx_after_tuple_change(self):
+        mdx_tuple = MdxTuple.of(Member.of("Dim1", "Elem1"))
+        mdx_builder = MdxBuilder.from_cube("cube").add_member_tuple_to_columns(mdx_tuple)
+        mdx_builder.to_mdx()
+
+        mdx_tuple.add_member(Member.of("Dim2", "Elem2"))
+
+        self.assertEqual(
+            "SELECT\r\n"
+            "{([dim1].[dim1].[elem1],[dim2].[dim2].[elem2])} DIMENSION PROPERTIES MEMBER_NAME ON 0\r\n"
+            "FROM [cube]",
+            mdx_builder.to_mdx())
+
+    def test_mdx_hierarchy_set_filter_by_cell_value_after_tuple_change(self):
+        mdx_tuple = MdxTuple.of(Member.of("Dim2", "Elem2"))
+        hierarchy_set = MdxHierarchySet.all_leaves("Dim1").filter_by_cell_value("cube", mdx_tuple, ">", 1)
+        head_set = hierarchy_set.head(10)
+        hierarchy_set.to_mdx()
+        head_set.to_mdx()
+
+        mdx_tuple.add_member(Member.of("Dim3", "Elem3"))
+
+        expected_mdx = "{FILTER({TM1FILTERBYLEVEL({TM1SUBSETALL([dim1].[dim1])},0)}," \
+                       "[cube].([dim2].[dim2].[elem2],[dim3].[dim3].[elem3])>1)}"
+        self.assertEqual(expected_mdx, hierarchy_set.to_mdx())
+        self.assertEqual(f"{{HEAD({expected_mdx},10)}}", head_set.to_mdx())
+
+    def test_mdx_tuple_add_members(self):
+        mdx_tuple = MdxTuple.of(Member.of("Dim1", "Elem1"))
+        mdx_tuple.add_members(["[Dim2].[Elem2]", Member.of("Dim3", "Elem3")])
+
+        self.assertEqual(
+            "([dim1].[dim1].[elem1],[dim2].[dim2].[elem2],[dim3].[dim3].[elem3])",
+            mdx_tuple.to_mdx())
+
+    def test_mdx_builder_add_hierarchy_sets_to_axis(self):
+        mdx = MdxBuilder.from_cube("cube") \
+            .add_hierarchy_sets_to_axis(0, [
+                MdxHierarchySet.member(Member.of("Dim1", "Elem1")),
+                MdxHierarchySet.member(Member.of("Dim2", "Elem2"))]) \
+            .to_mdx()
+
+        self.assertEqual(
+            "SELECT\r\n"
+            "{[dim1].[dim1].[elem1]} * {[dim2].[dim2].[elem2]} DIMENSION PROPERTIES MEMBER_NAME ON 0\r\n"
+            "FROM [cube]",
+            mdx)
+
+    def test_mdx_builder_add_member_tuples_to_axis(self):
+        mdx = MdxBuilder.from_cube("cube") \
+            .add_member_tuples_to_axis(0, [
+                MdxTuple.of(Member.of("Dim1", "Elem1"), Member.of("Dim2", "Elem2")),
+                MdxTuple.of(Member.of("Dim1", "Elem3"), Member.of("Dim2", "Elem4"))]) \
+            .to_mdx()
+
+        self.assertEqual(
+            "SELECT\r\n"
+            "{([dim1].[dim1].[elem1],[dim2].[dim2].[elem2]),([dim1].[dim1].[elem3],[dim2].[dim2].[elem4])} "
+            "DIMENSION PROPERTIES MEMBER_NAME ON 0\r\n"
+            "FROM [cube]",
+            mdx)
+
+    def test_mdx_builder_add_member_tuples_to_axis_invalid_argument(self):
+        mdx_builder = MdxBuilder.from_cube("cube")
+
+        with self.assertRaises(ValueError):
+            mdx_builder.add_member_tuples_to_axis(0, [Member.of("Dim1", "Elem1")])
+        with self.assertRaises(ValueError):
+            mdx_builder.add_member_tuples_to_axis(0, ["[Dim1].[Elem1]"])
+        self.assertFalse(mdx_builder.axes[0].tuples)
+
     def test_mdx_builder_multi_no_where(self):
         mdx = MdxBuilder.from_cube("cube") \
             .rows_non_empty() \
@@ -849,6 +1097,13 @@ class Test(unittest.TestCase):
             "FROM [cube]",
             mdx)
 
+    def test_mdx_builder_where_invalid_argument(self):
+        mdx_builder = MdxBuilder.from_cube("cube")
+        with pytest.raises(ValueError):
+            mdx_builder.where(Member.of("Dim1", "Elem1"), 1)
+
+        self.assertNotIn("WHERE", mdx_builder.to_mdx())
+
     def test_mdx_builder_multi_fail_combine_sets_tuples_on_axis(self):
         with pytest.raises(ValueError):
             MdxBuilder.from_cube("cube") \
@@ -1728,4 +1983,89 @@ class Test(unittest.TestCase):
         composition = ('cube', [], ['[dim1].[dim1]'], ['[period].[period]'])
         self.assertEqual(composition, mdx.get_composition())
 
+    def test_mdx_builder_to_clipboard_without_clipboard(self):
+        mdx_builder = MdxBuilder.from_cube("cube") \
+            .add_hierarchy_set_to_axis(0, MdxHierarchySet.member(Member.of("Dim1", "Elem1")))
+
+        with mock.patch.dict(sys.modules, {"pyperclip": None}), \
+                mock.patch.object(subprocess, "run", side_effect=OSError), \
+                mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            mdx_builder.to_clipboard()
+
+        self.assertEqual(
+            "SELECT {[dim1].[dim1].[elem1]} DIMENSION PROPERTIES MEMBER_NAME ON 0 FROM [cube]\n",
+            stdout.getvalue())
+
+    def test_mdx_hierarchy_set_to_clipboard_pyperclip_failure(self):
+        pyperclip = mock.Mock()
+        pyperclip.copy.side_effect = RuntimeError("no copy mechanism")
 
+        with mock.patch.dict(sys.modules, {"pyperclip": pyperclip}), \
+                mock.patch.object(subprocess, "run", side_effect=subprocess.CalledProcessError(1, "xclip")), \
+                mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            MdxHierarchySet.all_members("Dim1", "Dim1").to_clipboard()
+
+        self.assertEqual("{[dim1].[dim1].MEMBERS}\n", stdout.getvalue())
+
+    def test_get_composition_unused_axis(self):
+        mdx = MdxBuilder.from_cube(cube="Cube") \
+            .add_hierarchy_set_to_axis(2, MdxHierarchySet.all_members('dim1', 'dim1'))
+
+        self.assertEqual(['[dim1].[dim1]'], mdx.get_axis_composition(2))
+        with self.assertRaises(KeyError):
+            mdx.get_composition()
+
+    def test_mdx_builder_negative_axis(self):
+        mdx_builder = MdxBuilder.from_cube("cube") \
+            .add_hierarchy_set_to_axis(0, MdxHierarchySet.member(Member.of("Dim1", "Elem1")))
+
+        with self.assertRaises(ValueError):
+            mdx_builder.add_hierarchy_set_to_axis(-1, MdxHierarchySet.member(Member.of("Dim2", "Elem2")))
+        with self.assertRaises(KeyError):
+            mdx_builder.get_axis_composition(-1)
+
+    def test_multi_mdx_builder_add_sets_to_axis(self):
+        multi_subsets = ['Subset1', 'Subset2']
+        hierarchy_sets = [
+            MdxHierarchySet.member(Member.of("Dim1", "Elem1")),
+            MdxHierarchySet.member(Member.of("Dim2", "Elem2"))]
+
+        multi_mdx = MultiMdxBuilder.from_cube(cube="cube",
+                                              multi_dimension='MultiDim',
+                                              multi_hierarchy='MultiDim',
+                                              multi_subsets=multi_subsets,
+                                              multi_axis=1) \
+            .add_sets_to_axis(0, iter(hierarchy_sets)) \
+            .to_mdx()
+
+        for i, subset in enumerate(multi_subsets):
+            mdx = MdxBuilder.from_cube(cube="cube") \
+                .add_hierarchy_set_to_row_axis(MdxHierarchySet.tm1_subset_to_set(dimension='MultiDim',
+                                                                                 hierarchy='MultiDim',
+                                                                                 subset=subset)) \
+                .add_sets_to_axis(0, hierarchy_sets) \
+                .to_mdx()
+            self.assertEqual(mdx, multi_mdx[i])
+
+    def test_multi_mdx_builder_add_member_tuples_to_axis(self):
+        multi_subsets = ['Subset1', 'Subset2']
+        mdx_tuples = [
+            MdxTuple.of(Member.of("Dim1", "Elem1"), Member.of("Dim2", "Elem2")),
+            MdxTuple.of(Member.of("Dim1", "Elem3"), Member.of("Dim2", "Elem4"))]
+
+        multi_mdx = MultiMdxBuilder.from_cube(cube="cube",
+                                              multi_dimension='MultiDim',
+                                              multi_hierarchy='MultiDim',
+                                              multi_subsets=multi_subsets,
+                                              multi_axis=1) \
+            .add_member_tuples_to_axis(0, iter(mdx_tuples)) \
+            .to_mdx()
+
+        for i, subset in enumerate(multi_subsets):
+            mdx = MdxBuilder.from_cube(cube="cube") \
+                .add_hierarchy_set_to_row_axis(MdxHierarchySet.tm1_subset_to_set(dimension='MultiDim',
+                                                                                 hierarchy='MultiDim',
+                                                                                 subset=subset)) \
+                .add_member_tuples_to_axis(0, mdx_tuples) \
+                .to_mdx()
+            self.assertEqual(mdx, multi_mdx[i])